@@ -1,21 +1,39 @@
 import functools
+import json
 import logging
 import os
-import pickle
+import re
+import signal
+import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from selenium.common.exceptions import *
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
-from .browser import get_browser
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional, sessions fall back to the standard `json` module.
+
+from .browser import LazyBrowser, get_browser
 from .config import get_config
 from .constants import *
 from .logger import get_logging_options, setup_logging
+from .pool import BrowserPool
+from .wait import BackoffWait
 
 CONFIG = get_config()
 DEBUG_ON_EXCEPTION = CONFIG["Browser"].get("debug_on_exception", False)
@@ -25,10 +43,28 @@ GLOBAL_TIMEOUT_SEC = CONFIG["Browser"].get("global_timeout_sec", 5)
 SESSION_PATH = CONFIG["Browser"].get("session_path")
 KILL_CHROMIUM_BEFORE_START = CONFIG["Browser"].get("kill_chromium_before_start", False)
 KILL_WD_BEFORE_START = CONFIG["Browser"].get("kill_wd_before_start", False)
+POOL_MAXSIZE = CONFIG["Browser"].get("pool_maxsize", 10)
+BROWSER_POOL_SIZE = CONFIG["Browser"].get("browser_pool_size", 1)
+SCREENSHOTS_PATH = CONFIG["Browser"].get("screenshots_path")
+SCREENSHOTS_DIR = Path(SCREENSHOTS_PATH).expanduser() if SCREENSHOTS_PATH else None
+CSS_ATTR_NAME_EXPR = re.compile(r"[A-Za-z_][\w-]*")
 
 setup_logging(*get_logging_options(CONFIG["Logging"]))
 logger = logging.getLogger(__name__)
 
+if SCREENSHOTS_DIR:
+    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def log_elapsed(name, message, elapsed_ns):
+    """Log the time an action took."""
+
+    seconds, elapsed_ns = divmod(elapsed_ns, 1_000_000_000)
+    if message:
+        logger.info("%s::%s => %d.%05d seconds", name, message, seconds, elapsed_ns // 10_000)
+    else:
+        logger.info("%s => %d.%05d seconds", name, seconds, elapsed_ns // 10_000)
+
 
 def log_action(message=None):
     """Decorator to log an action."""
@@ -36,14 +72,11 @@ def log_action(message=None):
     def timer(func):
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            tic = time.perf_counter()
+            if not logger.isEnabledFor(logging.INFO):
+                return func(*args, **kwargs)
+            tic = time.perf_counter_ns()
             value = func(*args, **kwargs)
-            toc = time.perf_counter()
-            elapsed_time = toc - tic
-            if message:
-                logger.info(f"{func.__name__}::{message} => {elapsed_time:0.5f} seconds")
-            else:
-                logger.info(f"{func.__name__} => {elapsed_time:0.5f} seconds")
+            log_elapsed(func.__name__, message, time.perf_counter_ns() - tic)
             return value
 
         return wrapped
@@ -51,6 +84,76 @@ def log_action(message=None):
     return timer
 
 
+class LogTimer:
+    """Context manager to log an action, for calls whose message depends on the arguments.
+    Unlike `log_action`, it doesn't build a new decorated function on every call."""
+
+    __slots__ = ("name", "message", "tic")
+
+    def __init__(self, name, message=None):
+        self.name = name
+        self.message = message
+
+    def __enter__(self):
+        self.tic = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and logger.isEnabledFor(logging.INFO):
+            log_elapsed(self.name, self.message, time.perf_counter_ns() - self.tic)
+
+
+def run_quietly(args):
+    """Run a command without a shell, discarding its output."""
+
+    try:
+        subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    except FileNotFoundError:
+        logger.warning(f"Command not found -> {args[0]}")
+
+
+def find_pids(process_name):
+    """Yield the PIDs of processes whose name starts with `process_name` (Linux only).
+    Unless running as root, only processes owned by the current user are considered."""
+
+    prefix = process_name.encode()
+    uid = os.getuid()
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                if uid and entry.stat().st_uid != uid:
+                    continue  # Another user's process, which can't be signalled anyway.
+                with open(f"/proc/{entry.name}/comm", "rb", buffering=0) as f:
+                    if f.read(16).startswith(prefix):
+                        yield int(entry.name)
+            except OSError:
+                continue  # Process exited or is not readable.
+
+
+def pidfd_kill(process_name):
+    """Send `SIGKILL` to processes named `process_name` through pidfds, which are safe against PID reuse.
+    Return False if pidfds are not supported on this platform or kernel."""
+
+    if not hasattr(os, "pidfd_open"):
+        return False
+    for pid in find_pids(process_name):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            continue
+        except OSError:
+            return False  # Kernel older than 5.3.
+        try:
+            signal.pidfd_send_signal(fd, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass  # Exited meanwhile, or owned by another user.
+        finally:
+            os.close(fd)
+    return True
+
+
 @log_action()
 def kill_orphaned_processes():
     """Kill orphaned `chromedriver` processes if any.
@@ -58,9 +161,9 @@ def kill_orphaned_processes():
     that are not killed when the browser is manually closed."""
 
     if sys.platform == "win32":
-        os.system("taskkill /im chromedriver.exe /f")
-    else:
-        os.system("pkill -f chromedriver")
+        run_quietly(["taskkill", "/im", "chromedriver.exe", "/f"])
+    elif not pidfd_kill("chromedriver"):
+        run_quietly(["pkill", "-f", "chromedriver"])
 
 
 @log_action()
@@ -68,28 +171,132 @@ def kill_chromium():
     """Kill `chromium` processes."""
 
     if sys.platform == "win32":
-        os.system("taskkill /im chrome.exe /f")
+        run_quietly(["taskkill", "/im", "chrome.exe", "/f"])
+    elif not pidfd_kill("chrom"):  # chrome, chromium and their helpers.
+        run_quietly(["pkill", "-f", "chrome"])
+
+
+_leftovers_killed = False
+_leftovers_lock = threading.Lock()
+
+
+def kill_leftover_processes():
+    """Kill leftover processes if configured to.
+    Runs only once, before the first browser is started, so browsers started since are never killed."""
+
+    global _leftovers_killed
+    with _leftovers_lock:
+        if _leftovers_killed:
+            return
+        _leftovers_killed = True
+
+        if not QUIT_WHEN_DONE or KILL_WD_BEFORE_START:
+            kill_orphaned_processes()
+
+        if KILL_CHROMIUM_BEFORE_START:
+            kill_chromium()
+
+
+def start_browser():
+    """Kill leftover processes if configured to, then start the browser."""
+
+    kill_leftover_processes()
+    return get_browser(CONFIG["Browser"])
+
+
+browser = LazyBrowser(start_browser)  # Started on first use.
+# Extra browsers, started on first `pool.acquire()`. They get temporary profiles,
+# as chromium locks the configured one while `browser` is running.
+pool = BrowserPool(
+    {key: value for key, value in CONFIG["Browser"].items() if key != "chromium_profile_path"},
+    BROWSER_POOL_SIZE,
+    before_start=kill_leftover_processes,
+)
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+_WAIT = BackoffWait(browser, GLOBAL_TIMEOUT_SEC, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+
+
+def _wait_for(timeout=None):
+    """Return the shared wait, or a new one if `timeout` differs from the global timeout."""
+
+    if timeout is None or timeout == GLOBAL_TIMEOUT_SEC:
+        return _WAIT
+    return BackoffWait(browser, timeout, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+
+
+def handle_not_found(message):
+    """Log `message` after a failed wait, then save a screenshot, debug or exit as configured."""
+
+    logger.error(message)
+    if SCREENSHOT_ON_EXCEPTION:
+        save_screenshot()
+    if DEBUG_ON_EXCEPTION:
+        breakpoint()
     else:
-        os.system("pkill -f chrome")
+        sys.exit(1)
+
+
+def xpath_literal(value):
+    """Return `value` quoted as an XPath string literal, using `concat()` if it contains both quote types."""
+
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+@functools.lru_cache(maxsize=512)
+def attr_xpath(attr, value):
+    """Return the XPath matching any element whose `attr` equals `value`."""
+
+    return f"//*[@{attr}={xpath_literal(value)}]"
+
+
+def css_string(value):
+    """Return `value` quoted as a CSS string."""
 
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\a ") + '"'
 
-if not QUIT_WHEN_DONE or KILL_WD_BEFORE_START:
-    kill_orphaned_processes()
 
-if KILL_CHROMIUM_BEFORE_START:
-    kill_chromium()
+@functools.lru_cache(maxsize=512)
+def attr_locator(attr, value):
+    """Return the fastest locator matching any element whose `attr` equals `value`.
+    `id` and `name` use their native locators, other attributes a CSS selector and XPath is the last resort."""
 
-browser = get_browser(CONFIG["Browser"])
+    if attr == "id":
+        return ID, value
+    if attr == "name":
+        return NAME, value
+    if CSS_ATTR_NAME_EXPR.fullmatch(attr):
+        return CSS_SELECTOR, f"[{attr}={css_string(value)}]"
+    return XPATH, attr_xpath(attr, value)
+
+
+def to_locator(element, find_by=ID):
+    """Return a `(find_by, value)` locator for `element`, given as a str or an `(attr, value)` tuple."""
+
+    match element:
+        case str():
+            return find_by, element
+        case (str() as attr, str() as value):
+            return attr_locator(attr, value)
+        case _:
+            raise TypeError(f"{repr(element)} <- Invalid element type. Must be str or tuple[str, str].")
+
+
+def session():
+    """Borrow a browser from the pool: `with session() as driver: ...`."""
+
+    return pool.acquire()
 
 
 def close():
     """Close the browser."""
 
-    @log_action()
-    def _close():
-        browser.close()
-
-    _close()
+    if browser.started:
+        with LogTimer("close"):
+            browser.close()
 
 
 def quit():
@@ -112,12 +319,9 @@ def title():
 def go(url):
     """Go to a URL."""
 
-    @log_action(f"Go -> {url}")
-    def _go():
+    with LogTimer("go", f"Go -> {url}"):
         browser.get(url)
 
-    _go()
-
 
 @log_action()
 def refresh():
@@ -143,59 +347,29 @@ def forward():
 def wait(sec):
     """Wait for a number of seconds."""
 
-    @log_action(f"Wait -> {sec} seconds")
-    def _wait():
+    with LogTimer("wait", f"Wait -> {sec} seconds"):
         time.sleep(sec)
 
-    _wait()
-
 
 def wait_until_page_contains(text, timeout=GLOBAL_TIMEOUT_SEC):
     """Wait until the page contains the given text."""
 
-    @log_action(f"Wait until page contains -> {text}")
-    def _wait_until_page_contains():
+    with LogTimer("wait_until_page_contains", f"Wait until page contains -> {text}"):
         try:
-            WebDriverWait(browser, timeout).until(EC.text_to_be_present_in_element((TAG_NAME, "body"), text))
+            _wait_for(timeout).until(EC.text_to_be_present_in_element((TAG_NAME, "body"), text))
         except TimeoutException:
             logger.error(f"Timeout waiting for page to contain -> {text}")
             sys.exit(1)
 
-    _wait_until_page_contains()
-
 
 def wait_until_element_contains(text, element, find_by=ID, timeout=GLOBAL_TIMEOUT_SEC):
     """Wait until the element contains the given text."""
 
-    @log_action(f"Wait until element {element} contains -> {text}")
-    def _wait_until_element_contains():
+    with LogTimer("wait_until_element_contains", f"Wait until element {element} contains -> {text}"):
         try:
-            match element:
-                case str():
-                    return WebDriverWait(browser, timeout).until(
-                        EC.text_to_be_present_in_element((element, find_by), text)
-                    )
-                case (str(), str()):
-                    try:
-                        attr, value = element
-                        return WebDriverWait(browser, timeout).until(
-                            EC.text_to_be_present_in_element((XPATH, f"//*[@{attr}='{value}']"), text)
-                        )
-                    except ValueError:
-                        TypeError(f"{repr(element)} <- Invalid element tuple. Must be (attr, value).")
-                case _:
-                    raise TypeError(f"{repr(element)} <- Invalid element type. Must be str or tuple[str, str].")
-
+            return _wait_for(timeout).until(EC.text_to_be_present_in_element(to_locator(element, find_by), text))
         except TimeoutException:
-            logger.error(f"Timeout waiting for element {element} to contain -> {text}")
-            if SCREENSHOT_ON_EXCEPTION:
-                save_screenshot()
-            if DEBUG_ON_EXCEPTION:
-                breakpoint()
-            else:
-                sys.exit(1)
-
-    _wait_until_element_contains()
+            handle_not_found(f"Timeout waiting for element {element} to contain -> {text}")
 
 
 def get_cookie(name):
@@ -213,32 +387,56 @@ def get_cookies():
 def add_cookie(cookie):
     """Add a cookie: `{name: value}`."""
 
-    @log_action(f"Add cookie -> {cookie}")
-    def _add_cookie():
+    with LogTimer("add_cookie", f"Add cookie -> {cookie}"):
         browser.add_cookie(cookie)
 
-    _add_cookie()
+
+def to_cdp_cookie(cookie, url):
+    """Convert a WebDriver cookie to a CDP `Network.CookieParam`."""
+
+    cdp_cookie = {key: value for key, value in cookie.items() if key in CDP_COOKIE_KEYS}
+    if "expiry" in cookie:
+        cdp_cookie["expires"] = cookie["expiry"]
+    if "domain" not in cdp_cookie:
+        cdp_cookie["url"] = url
+    return cdp_cookie
+
+
+def add_cookies(cookies):
+    """Add several cookies with a single CDP command.
+    Falls back to adding them one by one if the command fails."""
+
+    with LogTimer("add_cookies", f"Add cookies -> {len(cookies)} cookies"):
+        url = browser.current_url
+        try:
+            browser.execute_cdp_cmd("Network.setCookies", {"cookies": [to_cdp_cookie(c, url) for c in cookies]})
+        except WebDriverException:
+            for cookie in cookies:
+                browser.add_cookie(cookie)
+
+
+def batch_cdp(cmds):
+    """Execute several CDP commands concurrently: `[(cmd, args), ...]`.
+    Return their results in the same order."""
+
+    with LogTimer("batch_cdp", f"Batch CDP -> {len(cmds)} commands"):
+        with ThreadPoolExecutor(max_workers=POOL_MAXSIZE) as executor:
+            return list(executor.map(lambda cmd: browser.execute_cdp_cmd(*cmd), cmds))
 
 
 def remove_cookie(name):
     """Remove a cookie by name."""
 
-    @log_action(f"Remove cookie -> {name}")
-    def _remove_cookie():
+    with LogTimer("remove_cookie", f"Remove cookie -> {name}"):
         browser.delete_cookie(name)
 
-    _remove_cookie()
-
 
 def remove_cookies():
     """Remove all cookies."""
 
-    @log_action("Remove all cookies")
-    def _remove_all_cookies():
+    with LogTimer("remove_cookies", "Remove all cookies"):
         browser.delete_all_cookies()
 
-    _remove_all_cookies()
-
 
 def check_session_path():
     """Check if session path is set."""
@@ -249,20 +447,21 @@ def check_session_path():
 
 @log_action()
 def save_session():
-    """Save the current session to a file."""
+    """Save the current session (URL and cookies) to a JSON file."""
 
     check_session_path()
 
     cookies = get_cookies()
     cookies.insert(0, {"url": browser.current_url})
 
-    with open(SESSION_PATH, "wb") as f:
-        try:
-            pickle.dump(cookies, f)
-            logger.info(f"Save session -> {SESSION_PATH}")
-        except Exception as e:
-            logger.error(f"Error saving session -> {e}")
-            sys.exit(1)
+    try:
+        data = orjson.dumps(cookies) if orjson else json.dumps(cookies).encode()
+        with open(SESSION_PATH, "wb") as f:
+            f.write(data)
+        logger.info(f"Save session -> {SESSION_PATH}")
+    except Exception as e:
+        logger.error(f"Error saving session -> {e}")
+        sys.exit(1)
 
 
 @log_action()
@@ -273,10 +472,9 @@ def restore_session():
 
     with open(SESSION_PATH, "rb") as f:
         try:
-            cookies = pickle.load(f)
+            cookies = orjson.loads(f.read()) if orjson else json.loads(f.read())
             go(cookies.pop(0)["url"])
-            for cookie in cookies:
-                add_cookie(cookie)
+            add_cookies(cookies)
             refresh()  # Refresh to apply cookies.
             logger.info(f"Restore session -> {SESSION_PATH}")
         except Exception as e:
@@ -287,39 +485,32 @@ def restore_session():
 def save_screenshot(name=None):
     """Save a screenshot of the current page."""
 
-    if not (screenshots_path := CONFIG["Browser"].get("screenshots_path")):
+    if not SCREENSHOTS_DIR:
         raise ValueError("screenshots_path <- Value not set in config file.")
-    if not Path(screenshots_path).exists():
-        Path(screenshots_path).mkdir(parents=True)
 
-    if name:
-        filename = str(Path(screenshots_path) / Path(f"screenshot_{name}_{time.time()}.png"))
-    else:
-        filename = str(Path(screenshots_path) / Path(f"screenshot_{time.time()}.png"))
+    prefix = f"screenshot_{name}_" if name else "screenshot_"
+    filename = str(SCREENSHOTS_DIR / f"{prefix}{time.time_ns()}.png")
 
-    @log_action(f"Save screenshot -> {filename}")
-    def _save_screenshot():
+    with LogTimer("save_screenshot", f"Save screenshot -> {filename}"):
         browser.save_screenshot(filename)
 
-    _save_screenshot()
-
 
 def save_screenshot_every_n_sec(n_sec, until_sec=0, name=None):
-    """Save a screenshot every `n` seconds, until `until_sec` seconds have passed."""
+    """Save a screenshot every `n` seconds, until `until_sec` seconds have passed.
+    Shots are scheduled against a monotonic clock, so capture time doesn't stretch the interval.
+    Slots missed during a slow capture are skipped rather than taken back to back."""
 
-    if not until_sec:
-        while True:
-            save_screenshot(name)
-            time.sleep(n_sec)
-    else:
-        if until_sec <= n_sec:
-            raise ValueError("until_sec <- Must be greater than n_sec.")
+    if until_sec and until_sec <= n_sec:
+        raise ValueError("until_sec <- Must be greater than n_sec.")
 
-        seconds_passed = 0
-        while seconds_passed < until_sec:
-            wait(n_sec)
-            seconds_passed += n_sec
-            save_screenshot(name=name)
+    next_shot = time.monotonic()
+    deadline = next_shot + until_sec if until_sec else float("inf")
+    # `next_shot` is never behind the clock, so no shot starts after the deadline.
+    while next_shot < deadline:
+        if (sleep_sec := next_shot - time.monotonic()) > 0:
+            time.sleep(sleep_sec)
+        save_screenshot(name=name)
+        next_shot = max(next_shot + n_sec, time.monotonic())
 
 
 def html():
@@ -335,34 +526,32 @@ def source():
 
 
 def page_contains_text(text):
-    """Check if page contains text."""
+    """Check if page contains text.
+    The check runs in the browser, so the page source is not transferred."""
+
+    return browser.execute_script(PAGE_CONTAINS_TEXT_JS, text)
 
-    return text in html()
+
+def page_contains_any(*texts):
+    """Check if page contains any of the texts, with a single script call."""
+
+    return browser.execute_script(PAGE_CONTAINS_ANY_JS, list(texts))
 
 
 def script(script):
     """Execute a script."""
 
-    @log_action(f"Execute script -> {script}")
-    def _script():
+    with LogTimer("script", f"Execute script -> {script}"):
         browser.execute_script(script)
 
-    _script()
-
 
 def get_alert():
     """Get an alert object."""
 
     try:
-        return WebDriverWait(browser, GLOBAL_TIMEOUT_SEC).until(EC.alert_is_present())
+        return _WAIT.until(EC.alert_is_present())
     except Exception as e:
-        logger.error(f"Alert not found -> {e}")
-        if SCREENSHOT_ON_EXCEPTION:
-            save_screenshot()
-        if DEBUG_ON_EXCEPTION:
-            breakpoint()
-        else:
-            sys.exit(1)
+        handle_not_found(f"Alert not found -> {e}")
 
 
 @log_action()
@@ -391,90 +580,150 @@ def get_element_obj(element, find_by=ID):
     """Get the object of an element."""
 
     try:
-        match element:
-            case str():
-                return WebDriverWait(browser, GLOBAL_TIMEOUT_SEC).until(
-                    EC.presence_of_element_located((find_by, element))
-                )
-            case (str(), str()):
-                try:
-                    attr, value = element
-                    return WebDriverWait(browser, GLOBAL_TIMEOUT_SEC).until(
-                        EC.presence_of_element_located((XPATH, f"//*[@{attr}='{value}']"))
-                    )
-                except ValueError:
-                    TypeError(f"{repr(element)} <- Invalid element tuple. Must be (attr, value).")
-            case _:
-                raise TypeError("f{repr(element)} <- Invalid element type. Must be str or tuple[str, str].")
+        return _WAIT.until(EC.presence_of_element_located(to_locator(element, find_by)))
+    except TimeoutException:
+        handle_not_found(f"Element not found -> {element}")
+
+
+def to_js_query(element, find_by=ID):
+    """Return a `(kind, query)` pair that `FIND_ELEMENTS_JS` can resolve, `kind` being "xpath" or "css"."""
+
+    by, value = to_locator(element, find_by)
+    if by == XPATH:
+        return "xpath", value
+    if by in (CSS_SELECTOR, TAG_NAME):
+        return "css", value
+    if by in (ID, NAME):
+        return "xpath", attr_xpath(by, value)
+    if by == CLASS_NAME:
+        return "xpath", f"//*[contains(concat(' ', normalize-space(@class), ' '), {xpath_literal(f' {value} ')})]"
+    raise ValueError(f"{by} <- Locator not supported for batch lookups.")
+
+
+def get_element_objs(elements, find_by=ID):
+    """Get the objects of several elements at once.
+    Each poll resolves all of them with a single script call instead of one lookup per element."""
+
+    if not (queries := [to_js_query(element, find_by) for element in elements]):
+        return []
+
+    def _all_present(driver):
+        element_objs = driver.execute_script(FIND_ELEMENTS_JS, queries)
+        return element_objs if None not in element_objs else False
+
+    try:
+        return _WAIT.until(_all_present)
+    except TimeoutException:
+        handle_not_found(f"Elements not found -> {elements}")
+
 
+def is_element_present(element, find_by=ID, timeout=0):
+    """Check if an element is present without raising or exiting.
+    With a `timeout`, wait up to that many seconds for it to appear."""
+
+    locator = to_locator(element, find_by)
+    if timeout <= 0:
+        return bool(browser.find_elements(*locator))
+    try:
+        _wait_for(timeout).until(EC.presence_of_element_located(locator))
+        return True
     except TimeoutException:
-        logger.error(f"Element not found -> {element}")
-        if SCREENSHOT_ON_EXCEPTION:
-            save_screenshot()
-        if DEBUG_ON_EXCEPTION:
-            breakpoint()
-        else:
-            sys.exit(1)
+        return False
+
+
+def element_text_located(locator):
+    """Expected condition returning `(element, text)` for the element at `locator`.
+    The lookup and the text read happen in the same poll, so a stale element is retried."""
+
+    def _predicate(driver):
+        element_obj = driver.find_element(*locator)
+        return element_obj, element_obj.text
+
+    return _predicate
 
 
 def get_element_text(element, find_by=ID):
     """Get the text of an element."""
 
-    return get_element_obj(element, find_by).text
+    try:
+        return _WAIT.until(element_text_located(to_locator(element, find_by)))[1]
+    except TimeoutException:
+        handle_not_found(f"Element not found -> {element}")
+
+
+def element_clicked(locator):
+    """Expected condition that clicks the element at `locator`.
+    A click that is intercepted or hits a not yet interactable element is retried on the next poll."""
+
+    def _predicate(driver):
+        try:
+            driver.find_element(*locator).click()
+            return True
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            return False
+
+    return _predicate
 
 
 def click(element, find_by=LINK_TEXT, alias=None):
     """Wait for an element to be available and click it."""
 
-    @log_action(f"Click -> {alias or element}")
-    def _click():
-        get_element_obj(element, find_by).click()
-
-    _click()
+    with LogTimer("click", f"Click -> {alias or element}"):
+        try:
+            _WAIT.until(element_clicked(to_locator(element, find_by)))
+        except TimeoutException:
+            handle_not_found(f"Element not clickable -> {element}")
 
 
 def double_click(element, find_by=LINK_TEXT, alias=None):
     """Wait for an element to be available and double click it."""
 
-    @log_action(f"Double click -> {alias or element}")
-    def _double_click():
+    with LogTimer("double_click", f"Double click -> {alias or element}"):
         element_obj = get_element_obj(element, find_by)
         ActionChains(browser).double_click(element_obj).perform()
 
-    _double_click()
-
 
 def clear_text(element_obj):
     """Clear text from an element object."""
 
-    element_obj.send_keys(f"{Keys.CONTROL}a")
-    element_obj.send_keys(Keys.DELETE)
+    # `Keys.NULL` releases CONTROL before DELETE, all in a single request.
+    element_obj.send_keys(f"{Keys.CONTROL}a{Keys.NULL}{Keys.DELETE}")
+
+
+def replace_text(element_obj, text):
+    """Replace the value of a text input or textarea with a single script call.
+    Return False if the element or text can't be handled this way (e.g. text with special keys)."""
 
+    if any("\ue000" <= char <= "\uf8ff" for char in text):
+        return False  # `Keys` values must be typed.
+    return browser.execute_script(REPLACE_TEXT_JS, element_obj, text)
 
-def write(text, into_element=None, find_by=ID, alias=None, clear_first=True):
+
+def write(text, into_element=None, find_by=ID, alias=None, clear_first=True, fast=False):
     """Wait for an element to be available and write into it.
-    If no element is specified, send keys to the current page."""
+    If no element is specified, send keys to the current page.
+    With `fast` (and `clear_first`), text fields are set in one script call instead of typed,
+    which skips key events, so don't use it with autocomplete, input masks or key-driven validation."""
 
-    @log_action(f"Write -> {text} -> {alias or into_element}")
-    def _write():
+    with LogTimer("write", f"Write -> {text} -> {alias or into_element}"):
         if into_element:
             element_obj = get_element_obj(into_element, find_by)
-            if clear_first:
-                # element_obj.clear()  # This doesn't work apparently.
-                clear_text(element_obj)
-            element_obj.send_keys(text)
+            if not (fast and clear_first and replace_text(element_obj, text)):
+                if clear_first:
+                    # element_obj.clear()  # This doesn't work apparently.
+                    clear_text(element_obj)
+                element_obj.send_keys(text)
         else:
             ActionChains(browser).send_keys(text).perform()
-            return
-
-    _write()
 
 
 __all__ = [
+    "BrowserPool",
     "CLASS_NAME",
     "CSS_SELECTOR",
     "ID",
     "LINK_TEXT",
+    "LogTimer",
     "NAME",
     "PARTIAL_LINK_TEXT",
     "QUIT_WHEN_DONE",
@@ -482,7 +731,9 @@ __all__ = [
     "XPATH",
     "accept_alert",
     "add_cookie",
+    "add_cookies",
     "back",
+    "batch_cdp",
     "browser",
     "click",
     "close",
@@ -494,13 +745,17 @@ __all__ = [
     "get_cookie",
     "get_cookies",
     "get_element_obj",
+    "get_element_objs",
     "get_element_text",
     "go",
     "html",
+    "is_element_present",
     "kill_chromium",
     "kill_orphaned_processes",
     "log_action",
+    "page_contains_any",
     "page_contains_text",
+    "pool",
     "quit",
     "refresh",
     "remove_cookie",
@@ -510,6 +765,7 @@ __all__ = [
     "save_screenshot_every_n_sec",
     "save_session",
     "script",
+    "session",
     "source",
     "title",
     "wait",
@@ -1,10 +1,41 @@
+import functools
+import json
 import os
+import threading
+import time
+from pathlib import Path
 from typing import Any
 
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from webdriver_manager.chrome import ChromeDriverManager
 
+DRIVER_CACHE_PATH = Path("~/.cache/seleniumlib/driver.json").expanduser()
+DRIVER_CACHE_MAX_AGE_SEC = 7 * 24 * 60 * 60
+
+
+class LazyBrowser:
+    """Proxy that starts the browser returned by `factory` on first attribute access."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self):
+        """Whether the browser has been started."""
+
+        return self._instance is not None
+
+    def __getattr__(self, name):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return getattr(self._instance, name)
+
 
 def get_browser(browser_config: dict[str, str | int | bool]) -> Any:
     """Returns a browser instance based on the config file."""
@@ -15,44 +46,181 @@ def get_browser(browser_config: dict[str, str | int | bool]) -> Any:
         raise ValueError(f"{page_load_strategy} <- Invalid page load strategy. Must be one of: NORMAL, EAGER, NONE.")
     desired_caps: dict[str, str] = DesiredCapabilities.CHROME
     desired_caps["pageLoadStrategy"] = page_load_strategy.lower()
-    return webdriver.Chrome(ChromeDriverManager().install(), options=chrome_options, desired_capabilities=desired_caps)
+    pool_maxsize = browser_config.get("pool_maxsize", 10)
+    if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+        raise ValueError(f"{pool_maxsize} <- Invalid pool max size. Must be a positive integer.")
+    service = Service(resolve_driver_path(chrome_options.binary_location))
+    driver = webdriver.Chrome(service=service, options=chrome_options, desired_capabilities=desired_caps)
+    set_pool_maxsize(driver, pool_maxsize)
+    return driver
+
+
+@functools.lru_cache(maxsize=4)
+def resolve_driver_path(chromium_executable_path):
+    """Return the `chromedriver` path, reusing the one cached on disk while it is fresh.
+    The cache is keyed by the chromium binary, so upgrading the browser resolves the driver again.
+    The result is also kept in memory for the lifetime of the process."""
+
+    try:
+        browser_key = f"{chromium_executable_path}:{os.stat(chromium_executable_path).st_mtime_ns}"
+    except OSError:
+        browser_key = chromium_executable_path
+
+    try:
+        cached = json.loads(DRIVER_CACHE_PATH.read_text())
+        if (
+            cached["browser"] == browser_key
+            and time.time() - cached["mtime"] < DRIVER_CACHE_MAX_AGE_SEC
+            and os.access(cached["path"], os.X_OK)
+        ):
+            return cached["path"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable cache, resolve again.
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_PATH.write_text(json.dumps({"browser": browser_key, "path": driver_path, "mtime": time.time()}))
+    except OSError:
+        pass  # Caching is best effort.
+    return driver_path
+
+
+def set_pool_maxsize(driver, pool_maxsize):
+    """Let the driver's connection pool hold `pool_maxsize` connections.
+    The default pool keeps a single connection, so concurrent commands queue up behind it.
+    The manager is updated in place, so a proxy manager built from the environment is kept."""
+
+    conn = driver.command_executor._conn
+    conn.connection_pool_kw["maxsize"] = pool_maxsize
+    conn.clear()  # Drop pools created with the old size; new ones pick up `maxsize`.
 
 
 def parse_browser_options(chrome_options, browser_config):
     """Parse browser options from config file."""
 
+    binary_location, arguments, experimental_options = get_option_spec(browser_config)
+    chrome_options.binary_location = binary_location
+    for argument in arguments:
+        chrome_options.add_argument(argument)
+    for name, value in experimental_options:
+        chrome_options.add_experimental_option(name, value.copy())
+    return chrome_options
+
+
+# id(config) -> (config, spec). Holding the config keeps its id from being reused.
+_option_spec_cache: dict[int, tuple[Any, Any]] = {}
+_OPTION_SPEC_CACHE_SIZE = 8
+
+
+def get_option_spec(browser_config):
+    """Return the option spec for `browser_config`, computing it only once per config object."""
+
+    if (cached := _option_spec_cache.get(id(browser_config))) and cached[0] is browser_config:
+        return cached[1]
+    if len(_option_spec_cache) >= _OPTION_SPEC_CACHE_SIZE:
+        _option_spec_cache.clear()  # Configs built per call; don't grow without bound.
+    spec = compute_option_spec(browser_config)
+    _option_spec_cache[id(browser_config)] = (browser_config, spec)
+    return spec
+
+
+def _headless(spec, value, browser_config):
+    """Run without a window."""
+
+    if value:
+        spec["arguments"] += ["--disable-gpu", "--headless"]
+
+
+def _sandbox(spec, value, browser_config):
+    """Disable the sandbox if `sandbox` is false."""
+
+    if not value:
+        spec["arguments"].append("--no-sandbox")
+
+
+def _window_size(spec, value, browser_config):
+    """Set the window size, unless the window starts maximized."""
+
+    if value and not browser_config.get("start_maximized"):
+        spec["arguments"].append(f"--window-size={value.get('width')},{value.get('height')}")
+
+
+def _start_maximized(spec, value, browser_config):
+    """Start with a maximized window."""
+
+    if value:
+        spec["arguments"].append("--start-maximized")
+
+
+def _user_agent(spec, value, browser_config):
+    """Override the user agent."""
+
+    if value:
+        spec["arguments"].append(f"user-agent={value}")
+
+
+def _chromium_profile_path(spec, value, browser_config):
+    """Use the given profile directory."""
+
+    if value:
+        spec["arguments"].append(f"user-data-dir={value}")
+
+
+def _downloads_path(spec, value, browser_config):
+    """Set the default downloads directory."""
+
+    if value:
+        spec["prefs"]["download.default_directory"] = value
+
+
+def _disable_selenium_logging(spec, value, browser_config):
+    """Stop chromium from logging to the console."""
+
+    if value:
+        spec["experimental_options"].append(("excludeSwitches", ["enable-logging"]))
+
+
+def _disable_wdm_logging(spec, value, browser_config):
+    """Silence `webdriver-manager` logging."""
+
+    if value:
+        os.environ["WDM_LOG"] = "0"
+
+
+# Config option -> handler adding it to the option spec.
+_OPTION_HANDLERS = {
+    "headless": _headless,
+    "sandbox": _sandbox,
+    "window_size": _window_size,
+    "start_maximized": _start_maximized,
+    "user_agent": _user_agent,
+    "chromium_profile_path": _chromium_profile_path,
+    "downloads_path": _downloads_path,
+    "disable_selenium_logging": _disable_selenium_logging,
+    "disable_wdm_logging": _disable_wdm_logging,
+}
+
+_PREFS_TEMPLATE = {
+    "safebrowsing.enabled": "false",
+    "profile.exit_type": "Normal",
+}
+
+
+def compute_option_spec(browser_config):
+    """Return `(binary_location, arguments, experimental_options)` built from the config file."""
+
     if not (chrome_executable_path := browser_config.get("chromium_executable_path")):
         raise ValueError("chrome_executable_path <- Value not set in config file.")
-    chrome_options.binary_location = chrome_executable_path
 
-    prefs: dict[str, Any] = {
-        "safebrowsing.enabled": "false",
-        "profile.exit_type": "Normal",
+    spec: dict[str, Any] = {
+        "arguments": [],
+        "experimental_options": [],
+        "prefs": _PREFS_TEMPLATE.copy(),
     }
-    for option in browser_config:
-        match option:
-            case "headless" if browser_config.get("headless"):
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--headless")
-            case "sandbox" if not browser_config.get("sandbox"):
-                chrome_options.add_argument("--no-sandbox")
-            case "window_size" if (
-                window_size := browser_config.get("window_size") and not browser_config.get("start_maximized")
-            ):
-                width, height = window_size.get("width"), window_size.get("height")
-                chrome_options.add_argument(f"--window-size={width},{height}")
-            case "start_maximized" if browser_config.get("start_maximized"):
-                chrome_options.add_argument("--start-maximized")
-            case "user_agent" if user_agent := browser_config.get("user_agent"):
-                chrome_options.add_argument(f"user-agent={user_agent}")
-            case "chromium_profile_path" if chromium_profile_path := browser_config.get("chromium_profile_path"):
-                chrome_options.add_argument(f"user-data-dir={chromium_profile_path}")
-            case "downloads_path" if downloads_path := browser_config.get("downloads_path"):
-                prefs["download.default_directory"] = downloads_path
-            case "disable_selenium_logging" if browser_config.get("disable_selenium_logging"):
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-            case "disable_wdm_logging" if browser_config.get("disable_wdm_logging"):
-                os.environ["WDM_LOG"] = "0"
-
-    chrome_options.add_experimental_option("prefs", prefs)
-    return chrome_options
+    for option, value in browser_config.items():
+        if handler := _OPTION_HANDLERS.get(option):
+            handler(spec, value, browser_config)
+
+    experimental_options = (*spec["experimental_options"], ("prefs", spec["prefs"]))
+    return chrome_executable_path, tuple(spec["arguments"]), experimental_options
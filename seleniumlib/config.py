@@ -1,54 +1,84 @@
+import functools
 import json
 import os
 import re
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
-ENV_VAR_EXPR = re.compile(r"{{(.*?)}}")
+ENV_VAR_EXPR = re.compile(r"\{\{([A-Za-z_][A-Za-z0-9_]*)\}\}")
 
 
-def extract_text_between_double_curly_braces(text):
-    """Extract environment variable between double curly braces."""
+def normalize_path(path):
+    """Return normalized `path` as string."""
 
-    try:
-        return re.findall(ENV_VAR_EXPR, text)[0]
-    except IndexError:
-        return None
+    # Relative paths resolve against the working directory, so it is part of the cache key.
+    return cached_normalize_path(path, None if os.path.isabs(path) else os.getcwd())
 
 
-def normalize_path(path):
-    """Return normalized `path` as string."""
+@functools.lru_cache(maxsize=256)
+def cached_normalize_path(path, cwd):
+    """Return normalized `path` as string. Cached per path and working directory."""
 
     n_path = Path(path).expanduser().resolve()
     return str(n_path)
 
 
+@functools.cache
+def script_dir():
+    """Return the directory of the running script."""
+
+    return str(Path(sys.argv[0]).parent)
+
+
+def replace_env_var(env, match):
+    """Return the value of the environment variable in `match`, or the match itself if it is not set."""
+
+    return env.get(match.group(1)) or match.group(0)
+
+
 def expand_env_vars(config):
     """Expand environment variables in config."""
-    os.environ["SCRIPT_DIR"] = str(Path(sys.argv[0]).parent)
+    os.environ.setdefault("SCRIPT_DIR", script_dir())
+    # Plain dict lookups skip the key encoding `os.environ` does on every access.
+    replace = functools.partial(replace_env_var, dict(os.environ))
 
-    for section in config.keys():
-        for key, value in config[section].items():
-            if not isinstance(value, str):
+    for values in config.values():
+        for key, value in values.items():
+            if not isinstance(value, str) or "{{" not in value:
                 continue
-            if env_var := extract_text_between_double_curly_braces(value):
-                if not os.environ.get(env_var):
-                    continue
-                config[section][key] = value.replace("{{" + env_var + "}}", os.environ[env_var])
-                if "path" in key:
-                    config[section][key] = normalize_path(config[section][key])
+            new_value = ENV_VAR_EXPR.sub(replace, value)
+            if new_value != value:
+                values[key] = normalize_path(new_value) if key == "path" or key.endswith("_path") else new_value
     return config
 
 
 def try_open_config_file(config_file):
-    """Try to open config file."""
+    """Try to open config file. Return the parsed config and its raw bytes."""
 
     try:
-        with open(config_file) as f:
-            return json.load(f)
+        data = Path(config_file).read_bytes()
     except FileNotFoundError:
         print(f"Config file {config_file} not found.")
         sys.exit(1)
+    return json.loads(data), data
+
+
+@functools.lru_cache(maxsize=8)
+def load_config_file(config_file, mtime_ns):
+    """Return the parsed config file with environment variables expanded, as a read-only mapping.
+    Cached per path and modification time."""
+
+    config, data = try_open_config_file(config_file)
+    if b"{{" in data:  # Most configs have no placeholders; skip walking every value.
+        config = expand_env_vars(config)
+    # Interned names match the literals used for lookups by identity, skipping string comparison.
+    return MappingProxyType(
+        {
+            sys.intern(section): MappingProxyType({sys.intern(key): value for key, value in values.items()})
+            for section, values in config.items()
+        }
+    )
 
 
 def get_config():
@@ -56,7 +86,13 @@ def get_config():
     If available, use path defined via `SELENIUMLIB_CFG` env var."""
 
     if seleniumlib_cfg := os.environ.get("SELENIUMLIB_CFG"):
-        config = try_open_config_file(normalize_path(seleniumlib_cfg))
+        config_file = normalize_path(seleniumlib_cfg)
     else:
-        config = try_open_config_file("config.json")
-    return expand_env_vars(config)
+        config_file = "config.json"
+
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+    except OSError:
+        mtime_ns = None  # Let `try_open_config_file` report the missing file.
+
+    return load_config_file(config_file, mtime_ns)
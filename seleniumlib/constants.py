@@ -8,3 +8,41 @@ NAME = By.NAME
 TAG_NAME = By.TAG_NAME
 CLASS_NAME = By.CLASS_NAME
 CSS_SELECTOR = By.CSS_SELECTOR
+
+# Keys shared by WebDriver cookies and CDP `Network.CookieParam`.
+CDP_COOKIE_KEYS = frozenset({"name", "value", "domain", "path", "secure", "httpOnly", "sameSite"})
+
+# Resolves a list of `(kind, query)` pairs to the first matching element of each, or null.
+FIND_ELEMENTS_JS = """
+return arguments[0].map(([kind, query]) => kind === "css"
+    ? document.querySelector(query)
+    : document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+"""
+
+# Checks the serialized page for `arguments[0]`, like `text in browser.page_source`.
+PAGE_CONTAINS_TEXT_JS = "return document.documentElement.outerHTML.includes(arguments[0]);"
+PAGE_CONTAINS_ANY_JS = """
+const source = document.documentElement.outerHTML;
+return arguments[0].some((text) => source.includes(text));
+"""
+
+# Sets the value of an editable text input or textarea through the native setter (so frameworks
+# like React notice) and fires the events typing would. Returns false for any other element,
+# or if `text` exceeds the field's `maxlength` (typing would truncate it).
+REPLACE_TEXT_JS = """
+const [element, text] = arguments;
+const textInput = element.tagName === "INPUT"
+    && ["text", "search", "email", "url", "tel", "password"].includes(element.type);
+if (!(textInput || element.tagName === "TEXTAREA") || element.readOnly || element.disabled) {
+    return false;
+}
+if (element.maxLength >= 0 && text.length > element.maxLength) {
+    return false;
+}
+const prototype = element.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+element.focus();
+Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, text);
+element.dispatchEvent(new Event("input", {bubbles: true}));
+element.dispatchEvent(new Event("change", {bubbles: true}));
+return true;
+"""
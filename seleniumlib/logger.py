@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 import os
 import sys
 
@@ -14,18 +15,21 @@ LOGGING_LEVEL = {
 
 LOGGING_MODES = {
     "append": "a",
+    "a": "a",
     "write": "w",
+    "w": "w",
 }
 
 
 def get_logging_options(logging_config):
-    """Return logging options from config."""
+    """Return logging options from config.
+    `level` is resolved to a `logging` level and `mode` to a file mode."""
 
     log_path = logging_config.get("log_path")
-    level = logging_config.get("level", "info")
+    level = LOGGING_LEVEL.get(logging_config.get("level", "info").lower(), logging.INFO)
     log_exceptions = logging_config.get("log_exceptions", True)
     display_stdout = logging_config.get("display_stdout", True)
-    mode = logging_config.get("mode", "a")
+    mode = LOGGING_MODES.get(logging_config.get("mode", "append").lower(), "a")
     return log_path, level, log_exceptions, display_stdout, mode
 
 
@@ -36,11 +40,13 @@ def setup_logging(log_path, level, log_exceptions, display_stdout, mode):
         return  # No logging.
 
     # Ensure directory structure.
-    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    if log_dir := os.path.dirname(log_path):
+        os.makedirs(log_dir, exist_ok=True)
 
-    level = LOGGING_LEVEL.get(level.lower(), logging.INFO)
-    mode = LOGGING_MODES.get(mode.lower(), "w")
-    handlers = [logging.FileHandler(log_path, mode=mode)]
+    # Buffer file writes, flushing on errors and when the buffer is full or logging shuts down.
+    # The file is opened on the first flush, so runs that log nothing never touch it.
+    file_handler = logging.FileHandler(log_path, mode=mode, delay=True)
+    handlers = [logging.handlers.MemoryHandler(512, flushLevel=logging.ERROR, target=file_handler)]
 
     if display_stdout:
         stdout_handler = logging.StreamHandler(sys.stdout)
@@ -53,6 +59,8 @@ def setup_logging(log_path, level, log_exceptions, display_stdout, mode):
         format="%(asctime)s::%(levelname)s::%(message)s",
         handlers=handlers,
     )
+    # `MemoryHandler` hands raw records to its target, which needs the formatter itself.
+    file_handler.setFormatter(handlers[0].formatter)
 
     def handle_exception(exc_type, exc_value, exc_traceback):
         """Log uncaught exceptions."""
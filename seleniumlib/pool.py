@@ -0,0 +1,120 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from .browser import get_browser, get_option_spec, resolve_driver_path
+
+
+class BrowserPool:
+    """Pool of browser instances created on demand and reused between callers.
+    All instances share `browser_config`, so leave `chromium_profile_path` unset when `size` is
+    greater than 1 or another browser uses the same profile (chromium locks its profile directory).
+    `before_start` is called before each browser is started, e.g. to clean up leftover processes."""
+
+    def __init__(self, browser_config, size, before_start=None):
+        if not isinstance(size, int) or size < 1:
+            raise ValueError(f"{size} <- Invalid pool size. Must be a positive integer.")
+        self._browser_config = browser_config
+        self._before_start = before_start
+        self._size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """Borrow a browser from the pool, waiting up to `timeout` seconds (forever if None) for one.
+        When it is returned, cookies are cleared and it is parked on `about:blank`.
+        A browser that fails to reset is quit and its slot freed."""
+
+        driver = self._get(timeout)
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except WebDriverException:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+
+    def prewarm(self):
+        """Start browsers in parallel until the pool holds `size` of them."""
+
+        if self._before_start:
+            self._before_start()
+        # Resolve the driver once up front, so threads don't all download it on a cold cache.
+        resolve_driver_path(get_option_spec(self._browser_config)[0])
+        with self._lock:
+            missing = self._size - self._created
+            self._created += missing
+        if missing <= 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(get_browser, self._browser_config) for _ in range(missing)]
+
+        error = None
+        for future in futures:
+            try:
+                self._idle.put(future.result())
+            except Exception as e:
+                with self._lock:
+                    self._created -= 1
+                error = error or e
+        if error:
+            raise error
+
+    def _get(self, timeout=None):
+        """Return an idle browser, start a new one if below `size`, or wait for one to be returned."""
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self._size
+            if can_create:
+                self._created += 1
+
+        if not can_create:
+            try:
+                return self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutException(f"No browser returned to the pool within {timeout} seconds.") from None
+        try:
+            if self._before_start:
+                self._before_start()
+            return get_browser(self._browser_config)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _discard(self, driver):
+        """Quit a broken browser and free its slot."""
+
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass  # Already dead.
+        finally:
+            with self._lock:
+                self._created -= 1
+
+    def quit(self):
+        """Quit all idle browsers in the pool."""
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            driver.quit()
+            with self._lock:
+                self._created -= 1
@@ -0,0 +1,32 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class BackoffWait(WebDriverWait):
+    """`WebDriverWait` that polls quickly at first and doubles the interval after each miss,
+    up to `max_poll_frequency`. Fast elements are found sooner and long waits issue fewer requests."""
+
+    def __init__(self, driver, timeout, poll_frequency=0.05, max_poll_frequency=1.0, ignored_exceptions=None):
+        super().__init__(driver, timeout, poll_frequency=poll_frequency, ignored_exceptions=ignored_exceptions)
+        self._max_poll = max_poll_frequency
+
+    def until(self, method, message=""):
+        """Call `method` with the driver until it returns a truthy value or the timeout expires."""
+
+        screen = stacktrace = None
+        poll = self._poll
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                if value := method(self._driver):
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            if (remaining := end_time - time.monotonic()) <= 0:
+                break
+            time.sleep(min(poll, remaining))
+            poll = min(poll * 2, self._max_poll)
+        raise TimeoutException(message, screen, stacktrace)